@@ -12,9 +12,45 @@ from fastapi import Request
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+_CREATE_SESSION_SQL = text("""
+    SELECT access_token_expires_at, refresh_token_expires_at
+    FROM create_session (
+        p_app_id := :app_id,
+        p_user_id := :user_id,
+        p_access_token_hash := :access_token_hash,
+        p_refresh_token_hash := :refresh_token_hash,
+        p_ip_address := :ip_address,
+        p_user_agent := :user_agent
+    )""")
+_CREATE_MFA_CHALLENGE_SESSION_SQL = text("""
+    CALL create_mfa_challenge_session (
+        p_app_id := :app_id,
+        p_user_id := :user_id,
+        p_challenge_token_hash := :challenge_token_hash,
+        p_ip_address := :ip_address,
+        p_user_agent := :user_agent
+    )""")
+
+
+def get_client_metadata(request: Request) -> tuple[str | None, str]:
+    """
+    Return the client IP address and user agent recorded for audit purposes.
+
+    Reads the raw ASGI scope once instead of building Starlette's Address and Headers objects.
+
+    Args:
+        request: The HTTP request object to extract client information
+
+    Returns:
+        tuple[str | None, str]: The client IP address (if known) and the user agent (empty if absent).
+    """
+    client = request.scope.get("client")
+    user_agent = next((value for key, value in request.scope["headers"] if key == b"user-agent"), b"")
+    return (client[0] if client else None), user_agent.decode("latin-1")
+
 
 async def create_login_session(
-    user_id: int, db: AsyncSession, app_id: int, request: Request
+    user_id: int, db: AsyncSession, app_id: int, ip_address: str | None, user_agent: str
 ) -> dict[str, str | datetime]:
     """
     Create a session for the user and return session details.
@@ -24,9 +60,10 @@ async def create_login_session(
 
     Args:
         user_id: The ID of the user for whom the session is being created
-        db: Database session dependency
+        db: Database session, transactional (committed here) or autocommit (the commit is a no-op)
         app_id: The ID of the application for which the session is created
-        request: The HTTP request object to extract client information
+        ip_address: The client IP address recorded with the session, if known
+        user_agent: The client user agent recorded with the session
 
     Returns:
         dict[str, str | datetime]: A dictionary containing session tokens and their expiration dates.
@@ -35,28 +72,18 @@ async def create_login_session(
     refresh_token = create_token()
 
     result = await db.execute(
-        text(
-            """
-            SELECT access_token_expires_at, refresh_token_expires_at
-            FROM create_session (
-                p_app_id := :app_id,
-                p_user_id := :user_id,
-                p_access_token_hash := :access_token_hash,
-                p_refresh_token_hash := :refresh_token_hash,
-                p_ip_address := :ip_address,
-                p_user_agent := :user_agent
-            )"""
-        ),
+        _CREATE_SESSION_SQL,
         {
             "app_id": app_id,
             "user_id": user_id,
             "access_token_hash": hash_token(access_token),
             "refresh_token_hash": hash_token(refresh_token),
-            "ip_address": request.client.host if request.client else None,
-            "user_agent": request.headers.get("user-agent", ""),
+            "ip_address": ip_address,
+            "user_agent": user_agent,
         },
     )
-    data = result.mappings().first()
+    data = result.first()
+    # Login runs on an autocommit session, but the TOTP routes call this inside a transaction that must be committed
     await db.commit()
 
     return {
@@ -67,7 +94,9 @@ async def create_login_session(
     }
 
 
-async def create_mfa_challenge_session(user_id: int, db: AsyncSession, app_id: int, request: Request) -> str:
+async def create_mfa_challenge_session(
+    user_id: int, db: AsyncSession, app_id: int, ip_address: str | None, user_agent: str
+) -> str:
     """
     Create a multi-factor authentication (MFA) challenge session for the user.
 
@@ -75,9 +104,10 @@ async def create_mfa_challenge_session(user_id: int, db: AsyncSession, app_id: i
 
     Args:
         user_id: The ID of the user for whom the MFA challenge is being created
-        db: Database session dependency
+        db: Database session, transactional (committed here) or autocommit (the commit is a no-op)
         app_id: The ID of the application for which the MFA challenge is created
-        request: The HTTP request object to extract client information
+        ip_address: The client IP address recorded with the session, if known
+        user_agent: The client user agent recorded with the session
 
     Returns:
         str: The challenge token for the MFA session
@@ -85,24 +115,16 @@ async def create_mfa_challenge_session(user_id: int, db: AsyncSession, app_id: i
     challenge_token = create_token()
 
     await db.execute(
-        text(
-            """
-            CALL create_mfa_challenge_session (
-                p_app_id := :app_id,
-                p_user_id := :user_id,
-                p_challenge_token_hash := :challenge_token_hash,
-                p_ip_address := :ip_address,
-                p_user_agent := :user_agent
-            )"""
-        ),
+        _CREATE_MFA_CHALLENGE_SESSION_SQL,
         {
             "app_id": app_id,
             "user_id": user_id,
             "challenge_token_hash": hash_token(challenge_token),
-            "ip_address": request.client.host if request.client else None,
-            "user_agent": request.headers.get("user-agent", ""),
+            "ip_address": ip_address,
+            "user_agent": user_agent,
         },
     )
+    # Login runs on an autocommit session, but the TOTP routes call this inside a transaction that must be committed
     await db.commit()
 
     return challenge_token
@@ -6,12 +6,39 @@ database interactions. It provides a dependency function for obtaining a
 database session in FastAPI endpoints.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import os
 
-DATABASE_URL = "postgresql+asyncpg://vscode@0.0.0.0:5432/authentication-service"
-engine = create_async_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL", "postgresql+asyncpg://vscode@0.0.0.0:5432/authentication-service").replace(
+    "postgresql://", "postgresql+asyncpg://", 1
+)
+
+# Pool sizing can be tuned per deployment (e.g., to stay under the server's max_connections across workers)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Connections are reused across requests; the pool is sized so bursts queue briefly instead of timing out.
+# No pre-ping (it costs a round trip per checkout): stale connections are recycled before server-side timeouts.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=False,
+    pool_recycle=DB_POOL_RECYCLE,
+)
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+# Same pool, but each statement commits on its own: no BEGIN/COMMIT round trips for single-statement handlers
+autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+AutocommitSessionLocal = async_sessionmaker(bind=autocommit_engine, class_=AsyncSession, expire_on_commit=False)
 
 
 async def get_db():
@@ -26,3 +53,18 @@ async def get_db():
     """
     async with SessionLocal() as session:
         yield session
+
+
+async def get_autocommit_db():
+    """
+    Dependency that provides a SQLAlchemy asynchronous session in autocommit mode.
+
+    Yields:
+        AsyncSession: An async session whose statements are committed as soon as they run.
+
+    Usage:
+        Use for endpoints that issue a single statement (e.g., one database function call),
+        where an explicit transaction would only add BEGIN and COMMIT round trips.
+    """
+    async with AutocommitSessionLocal() as session:
+        yield session
@@ -1,28 +1,28 @@
 """
 Email sending utilities.
 
-This module provides functions for sending emails using FastAPI background tasks
-and the FastMail library. It is used to send templated emails asynchronously
-throughout the application.
+This module provides functions for sending emails using the FastMail library.
+It is used to send templated emails asynchronously throughout the application.
 """
 
-from fastapi import BackgroundTasks
 from fastapi_mail import FastMail, MessageSchema, MessageType
 
 from .config import conf
 from .schemas import BaseEmailSchema
 
+# The configuration is fixed for the process, so one client serves every send
+_MAIL = FastMail(conf)
 
-def send_email_background(background_tasks: BackgroundTasks, email: BaseEmailSchema):
+
+async def send_email(email: BaseEmailSchema):
     """
-    Send an email in the background using FastAPI's BackgroundTasks.
+    Send an email immediately using FastMail.
 
     Args:
-        background_tasks (BackgroundTasks): The FastAPI background task manager.
         email (BaseEmailSchema): The email payload containing recipients, subject, template, and body.
 
-    This function creates a message from the provided schema and schedules it to be sent
-    asynchronously using FastMail and the specified template.
+    This function creates a message from the provided schema and sends it using the specified template.
+    It is meant to be awaited from code that already runs after the response, such as a background task.
     """
     message = MessageSchema(
         subject=email.subject,
@@ -30,5 +30,4 @@ def send_email_background(background_tasks: BackgroundTasks, email: BaseEmailSch
         template_body=email.body,
         subtype=MessageType.html,
     )
-    fm = FastMail(conf)
-    background_tasks.add_task(fm.send_message, message, template_name=email.template_path)
+    await _MAIL.send_message(message, template_name=email.template_path)
@@ -0,0 +1,110 @@
+"""
+In-memory rate limiting for abuse-prone endpoints.
+
+This module provides a fixed-window request counter and FastAPI helpers that reject clients
+exceeding it with HTTP 429 before any cryptography or database work runs.
+Counters live in process memory, so each worker enforces its own limits.
+"""
+
+import math
+import time
+from collections.abc import Hashable
+
+from fastapi import HTTPException, Request, status
+
+# Hard cap on tracked keys; past it the oldest windows are evicted, so a flood of distinct keys cannot grow memory
+MAX_TRACKED_KEYS = 10_000
+
+# Expired windows are dropped at most this often rather than on every hit
+PRUNE_INTERVAL_SECONDS = 1.0
+
+
+class RateLimiter:
+    """Fixed-window counter allowing `limit` hits per key every `window_seconds`."""
+
+    __slots__ = ("_next_prune", "_windows", "limit", "max_keys", "window_seconds")
+
+    def __init__(self, limit: int, window_seconds: float, max_keys: int = MAX_TRACKED_KEYS):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        # Ordered by window start: keys are (re)inserted at the end whenever their window opens
+        self._windows: dict[Hashable, tuple[float, int]] = {}
+        self._next_prune = 0.0
+
+    def hit(self, key: Hashable) -> bool:
+        """Record a hit for the key and return whether it is still within the limit."""
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self._prune(now)
+
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.window_seconds:
+            # Move the key to the end so the oldest windows stay at the front
+            self._windows.pop(key, None)
+            self._windows[key] = (now, 1)
+            while len(self._windows) > self.max_keys:
+                del self._windows[next(iter(self._windows))]
+            return True
+
+        window_start, count = window
+        self._windows[key] = (window_start, count + 1)
+        return count < self.limit
+
+    def retry_after(self, key: Hashable) -> int:
+        """Return the whole seconds left in the key's current window (at least 1)."""
+        window = self._windows.get(key)
+        if window is None:
+            return 1
+        remaining = window[0] + self.window_seconds - time.monotonic()
+        return max(1, math.ceil(remaining))
+
+    def _prune(self, now: float):
+        """Drop expired windows from the front of the dict, where the oldest ones are."""
+        windows = self._windows
+        while windows:
+            key = next(iter(windows))
+            if now - windows[key][0] < self.window_seconds:
+                break
+            del windows[key]
+        self._next_prune = now + PRUNE_INTERVAL_SECONDS
+
+
+def enforce_rate_limit(limiter: RateLimiter, key: Hashable):
+    """
+    Record a hit for the key and raise HTTP 429 if it exceeds the limiter's quota.
+
+    Args:
+        limiter: The limiter holding the counters
+        key: The value the quota applies to (e.g., a client IP or an email hash)
+
+    Raises:
+        HTTPException: 429 with a Retry-After header set to the time left in the window
+    """
+    if not limiter.hit(key):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(limiter.retry_after(key))},
+        )
+
+
+def rate_limit_by_ip(limiter: RateLimiter):
+    """
+    Build a dependency that rejects a client IP once it exceeds the limiter's quota.
+
+    Behind a reverse proxy the client IP is only correct if uvicorn trusts the proxy's forwarded headers
+    (see FORWARDED_ALLOW_IPS); otherwise every client shares the proxy's address.
+
+    Args:
+        limiter: The limiter holding the per-IP counters
+
+    Returns:
+        A FastAPI dependency raising HTTP 429 when the limit is exceeded.
+    """
+
+    async def dependency(request: Request):
+        client = request.scope.get("client")
+        enforce_rate_limit(limiter, client[0] if client else None)
+
+    return dependency
@@ -1,23 +1,23 @@
 from datetime import datetime
-from typing import Any, Dict
+from typing import Dict
 
 from fastapi import Response
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
 
-def create_login_response_with_cookies(response_data: Dict[str, Any], session: Dict[str, str | datetime]) -> Response:
+def create_login_response_with_cookies(response_data: BaseModel, session: Dict[str, str | datetime]) -> Response:
     """
     Create a JSON response with secure authentication cookies.
 
     Args:
-        response_data: The response data to include in the JSON body
+        response_data: The response model to serialize as the JSON body
         session: Dictionary containing access_token, refresh_token and their expiration dates
 
     Returns:
-        JSONResponse with secure httpOnly cookies set
+        Response with secure httpOnly cookies set
     """
-    response = JSONResponse(content=jsonable_encoder(response_data))
+    # pydantic-core serializes the model (UUIDs, datetimes) straight to JSON bytes
+    response = Response(content=response_data.model_dump_json(), media_type="application/json")
 
     # Attach secure cookies
     response.set_cookie(
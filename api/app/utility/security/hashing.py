@@ -1,9 +1,18 @@
 import hashlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _namespace_hasher(namespace: str) -> "hashlib._Hash":
+    """SHA-256 state already fed with the namespace prefix, copied for each value in that namespace."""
+    return hashlib.sha256(f"{namespace}:".encode())
 
 
 def hash_field(value: str, namespace: str) -> str:
     """SHA-256 hash of a UTF-8 value, for indexing."""
-    return hashlib.sha256(f"{namespace}:{value}".encode("utf-8")).hexdigest()
+    hasher = _namespace_hasher(namespace).copy()
+    hasher.update(value.encode("utf-8"))
+    return hasher.hexdigest()
 
 
 def hash_email(email: str, namespace: str) -> str:
@@ -1,8 +1,20 @@
+import base64
+import secrets
+
 import pyotp
 
 
+def generate_otp_secret(num_bytes: int = 20) -> str:
+    """Generate a base32 TOTP secret (20 random bytes give the usual 32-character, 160-bit secret)."""
+    return base64.b32encode(secrets.token_bytes(num_bytes)).decode("ascii").rstrip("=")
+
+
 def verify_otp(secret: str, otp_code: str, method: str = "TOTP", counter: int = 0) -> bool:
-    """Verify a one-time password (TOTP or HOTP)."""
+    """
+    Verify a one-time password (TOTP or HOTP).
+
+    pyotp compares the expected and provided codes with hmac.compare_digest, so the check is constant-time.
+    """
     try:
         if method == "TOTP":
             return pyotp.TOTP(secret).verify(otp_code)
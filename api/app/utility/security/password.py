@@ -1,7 +1,10 @@
+import asyncio
 import os
 import unicodedata
 from re import search
+from weakref import WeakKeyDictionary
 
+from anyio import CapacityLimiter, to_thread
 from argon2 import PasswordHasher
 from dotenv import load_dotenv
 
@@ -29,6 +32,30 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False
 
 
+# Argon2 is CPU bound and uses 64 MiB per hash by default, so run at most one hash per core instead of
+# letting the shared thread pool (40 threads) start dozens at once; one limiter per event loop, since a
+# limiter created on one loop cannot be awaited from another (test clients, reloads)
+_argon2_limiters: WeakKeyDictionary[asyncio.AbstractEventLoop, CapacityLimiter] = WeakKeyDictionary()
+
+
+def _get_argon2_limiter() -> CapacityLimiter:
+    loop = asyncio.get_running_loop()
+    limiter = _argon2_limiters.get(loop)
+    if limiter is None:
+        limiter = _argon2_limiters[loop] = CapacityLimiter(os.cpu_count() or 1)
+    return limiter
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in a worker thread without blocking the event loop."""
+    return await to_thread.run_sync(hash_password, password, limiter=_get_argon2_limiter())
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread without blocking the event loop."""
+    return await to_thread.run_sync(verify_password, password, hashed_password, limiter=_get_argon2_limiter())
+
+
 def validate_password_complexity(password: str) -> str:
     """
     Validates a password based on the following criteria:
@@ -15,7 +15,8 @@ import secrets
 from app.utility.database import get_db
 from dotenv import load_dotenv
 from fastapi import Depends, Header, HTTPException, status
-from sqlalchemy import text
+from sqlalchemy import Row, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 load_dotenv()
@@ -26,6 +27,12 @@ FIELD_HASH_SALT = os.getenv("FIELD_HASH_SALT", "public-tenant-aware-salt").encod
 if not TOKEN_PEPPER:
     raise RuntimeError("Missing required secret: TOKEN_PEPPER")
 
+# Keyed once; each hash copies this state instead of re-deriving the HMAC pads from the pepper
+_TOKEN_HMAC = hmac.new(TOKEN_PEPPER, digestmod=hashlib.sha256)
+
+_GET_ACCESS_TOKEN_SQL = text("SELECT * FROM get_access_token(p_token_hash := :p_token_hash)")
+_GET_TOTP_SECRET_SQL = text("SELECT * FROM get_totp_secret(p_token_hash := :p_token_hash)")
+
 
 def create_token(num_bytes: int = 32) -> str:
     """Generate a secure URL-safe token."""
@@ -34,7 +41,9 @@ def create_token(num_bytes: int = 32) -> str:
 
 def hash_token(token: str) -> bytes:
     """Hash a token using HMAC with SHA-256 and a pepper."""
-    return hmac.new(TOKEN_PEPPER, token.encode("utf-8"), hashlib.sha256).digest()
+    mac = _TOKEN_HMAC.copy()
+    mac.update(token.encode("utf-8"))
+    return mac.digest()
 
 
 def verify_token(token: str, stored_hash: bytes) -> bool:
@@ -42,21 +51,22 @@ def verify_token(token: str, stored_hash: bytes) -> bool:
     return hmac.compare_digest(hash_token(token), stored_hash)
 
 
+def parse_bearer_token(header_value: str | None, detail: str) -> str:
+    """Return the token from a "Bearer <token>" header value, or raise a 401 with the given detail."""
+    if not header_value or not header_value.startswith("Bearer "):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
+    return header_value[7:].strip()
+
+
 async def require_access_token(
     authorization: str = Header(..., alias="Authorization"),
     db: AsyncSession = Depends(get_db),
 ):
-    if not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format",
-        )
-
-    token = authorization.removeprefix("Bearer ").strip()
+    token = parse_bearer_token(authorization, "Invalid authorization header format")
     token_hash = hash_token(token)
 
     result = await db.execute(
-        text("SELECT * FROM get_access_token(p_token_hash := :p_token_hash)"),
+        _GET_ACCESS_TOKEN_SQL,
         {"p_token_hash": token_hash},
     )
 
@@ -74,19 +84,21 @@ async def require_access_token(
 async def require_challenge_token(
     mfa_challenge: str = Header(..., alias="X-TOTP-Challenge"),
     db: AsyncSession = Depends(get_db),
-) -> dict:
-    if not mfa_challenge.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid challenge header format",
-        )
-    token = mfa_challenge.removeprefix("Bearer ").strip()
+) -> Row:
+    token = parse_bearer_token(mfa_challenge, "Invalid challenge header format")
 
-    result = await db.execute(
-        text("SELECT * FROM get_totp_secret(p_token_hash := :p_token_hash)"),
-        {"p_token_hash": hash_token(token)},
-    )
-    data = result.mappings().first()
+    try:
+        result = await db.execute(
+            _GET_TOTP_SECRET_SQL,
+            {"p_token_hash": hash_token(token)},
+        )
+    except DBAPIError as e:
+        # get_totp_secret raises AU006 for unknown challenge tokens; anything else is unexpected
+        if getattr(e.orig, "sqlstate", None) != "AU006":
+            raise
+        data = None
+    else:
+        data = result.first()
 
     if not data:
         raise HTTPException(
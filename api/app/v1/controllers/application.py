@@ -1,5 +1,7 @@
 from uuid import UUID
 
+from app.utility.database import get_autocommit_db
+from fastapi import Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,56 +15,58 @@ from ..schemas.application import (
 )
 from .base import BaseController
 
+_GET_APPLICATION_SQL = text("SELECT * FROM get_application(:app_id)")
+_REGISTER_APPLICATION_SQL = text(
+    "SELECT register_application(p_name := :name, p_slug := :slug, p_description := :description)"
+)
+_UPDATE_APPLICATION_SQL = text("""
+    SELECT * FROM update_application(
+        p_app_id := :app_id,
+        p_new_name := :new_name,
+        p_new_slug := :new_slug,
+        p_new_description := :new_description,
+        p_new_status := :new_status
+    )""")
+_DELETE_APPLICATION_SQL = text("SELECT delete_application(p_app_id := :app_id)")
+
 
 class ApplicationController(BaseController):
     """Controller for application-related operations."""
 
-    def __init__(self, db: AsyncSession):
+    __slots__ = ()
+
+    # Every operation is a single database function call, so no explicit transaction is needed
+    def __init__(self, db: AsyncSession = Depends(get_autocommit_db)):
         super().__init__(db)
 
     async def get_application_by_id(self, app_id: UUID) -> AppGetResponse:
-        result = await self.db.execute(text("SELECT * FROM get_application(:app_id)").bindparams(app_id=app_id))
-        row = result.mappings().first()
+        result = await self.db.execute(_GET_APPLICATION_SQL, {"app_id": app_id})
+        row = result.mappings().one_or_none()
         if row is None:
             self.handle_not_found("Application")
-        return AppGetResponse.model_validate(row)
+        return AppGetResponse.model_construct(**row)
 
     async def create_application(self, payload: AppCreate) -> AppCreateResponse:
         result = await self.db.execute(
-            text("SELECT register_application(p_name := :name, p_slug := :slug, p_description := :description)"),
+            _REGISTER_APPLICATION_SQL,
             payload.model_dump(),
         )
         app_id = result.scalar()
-        await self.db.commit()
         return AppCreateResponse(app_id=app_id)
 
     async def update_application(self, payload: AppUpdate) -> AppUpdateResponse:
-        if not any([payload.new_name, payload.new_slug, payload.new_description]):
+        if not any((payload.new_name, payload.new_slug, payload.new_description)):
             self.handle_bad_request("At least one field must be updated")
 
-        result = await self.db.execute(
-            text(
-                """
-                SELECT * FROM update_application(
-                    p_app_id := :app_id,
-                    p_new_name := :new_name,
-                    p_new_slug := :new_slug,
-                    p_new_description := :new_description,
-                    p_new_status := :new_status
-                )"""
-            ),
-            payload.model_dump(),
-        )
-        row = result.mappings().first()
-        if not row:
+        result = await self.db.execute(_UPDATE_APPLICATION_SQL, payload.model_dump())
+        row = result.mappings().one_or_none()
+        if row is None:
             self.handle_not_found("Application")
-        await self.db.commit()
-        return AppUpdateResponse.model_validate(row)
+        return AppUpdateResponse.model_construct(**row)
 
     async def delete_application(self, app_id: UUID) -> AppDeleteResponse:
-        result = await self.db.execute(text("SELECT delete_application(p_app_id := :app_id)"), {"app_id": app_id})
+        result = await self.db.execute(_DELETE_APPLICATION_SQL, {"app_id": app_id})
         name = result.scalar_one_or_none()
         if name is None:
             self.handle_not_found("Application")
-        await self.db.commit()
         return AppDeleteResponse(name=name)
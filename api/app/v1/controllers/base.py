@@ -1,19 +1,17 @@
-import logging
 from abc import ABC
-from typing import Any, Dict, Optional
+from typing import Optional
 
 from app.utility.database import get_db
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import text
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-logger = logging.getLogger(__name__)
-
 
 class BaseController(ABC):
     """Base controller class with common functionality for all controllers."""
 
+    # Controllers are created per request and only hold the session
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession = Depends(get_db)):
         self.db = db
 
@@ -37,24 +35,3 @@ class BaseController(ABC):
     def handle_conflict(self, detail: str = "Resource already exists"):
         """Handle conflict errors consistently."""
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
-
-    async def execute_procedure(self, procedure: str, params: Dict[str, Any]) -> Optional[Any]:
-        """Execute a database procedure safely with error handling."""
-        try:
-            result = await self.db.execute(text(procedure), params)
-            return result.scalar_one_or_none()
-        except IntegrityError as e:
-            logger.warning(f"Integrity error in procedure {procedure}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Database error in procedure {procedure}: {e}")
-            raise
-
-    async def commit_transaction(self):
-        """Commit the current transaction with error handling."""
-        try:
-            await self.db.commit()
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Transaction commit failed: {e}")
-            raise
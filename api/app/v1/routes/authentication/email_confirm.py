@@ -1,8 +1,15 @@
-from app.utility.database import get_db
-from app.utility.security.password import hash_password
-from app.utility.security.tokens import hash_token
+import asyncio
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from app.utility.authentication import get_client_metadata
+from app.utility.database import get_autocommit_db
+from app.utility.rate_limit import RateLimiter, rate_limit_by_ip
+from app.utility.security.password import hash_password_async
+from app.utility.security.tokens import hash_token, parse_bearer_token
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...schemas.pending_user import (
@@ -13,17 +20,41 @@ from ...schemas.pending_user import (
 router = APIRouter()
 MIN_RESPONSE_TIME_SECONDS = 0.45
 
+# Each attempt costs an Argon2 hash, so cap token guessing per client before it reaches the hasher
+_CONFIRM_IP_LIMITER = RateLimiter(limit=10, window_seconds=60)
+
+_CONFIRM_PENDING_USER_SQL = text("""
+    SELECT confirm_pending_user(
+        p_app_id := :app_id,
+        p_token_hash := :token_hash,
+        p_password := :password,
+        p_ip_address := :ip_address,
+        p_user_agent := :user_agent
+    )""")
+
+# SQLSTATEs raised by confirm_pending_user, mapped to the HTTP error returned to the client
+_CONFIRM_ERRORS: Mapping[str, tuple[int, str]] = MappingProxyType(
+    {
+        "AU001": (status.HTTP_404_NOT_FOUND, "Invalid verification token"),
+        "AU002": (status.HTTP_410_GONE, "Verification token has expired"),
+        "AU003": (status.HTTP_404_NOT_FOUND, "Invalid or expired verification token"),
+        "AU004": (status.HTTP_410_GONE, "Registration has expired"),
+        "AU005": (status.HTTP_409_CONFLICT, "User account already exists"),
+    }
+)
+
 
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     response_model=RegisterConfirmationResponse,
     response_description="User account created successfully",
+    dependencies=[Depends(rate_limit_by_ip(_CONFIRM_IP_LIMITER))],
 )
 async def confirm_pending_user(
     request_body: RegisterConfirmationRequest,
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_autocommit_db),
     authorization: str = Header(None, alias="Authorization"),
 ):
     """
@@ -62,70 +93,41 @@ async def confirm_pending_user(
         - Atomic database operations to prevent race conditions
     """
 
-    # Define error mappings for cleaner exception handling
-    error_mappings = {
-        "Pending user not found": (
-            status.HTTP_404_NOT_FOUND,
-            "Invalid or expired verification token",
-        ),
-        "Invalid verification token": (
-            status.HTTP_404_NOT_FOUND,
-            "Invalid verification token",
-        ),
-        "Token has expired": (
-            status.HTTP_410_GONE,
-            "Verification token has expired",
-        ),
-        "Registration has expired": (
-            status.HTTP_410_GONE,
-            "Registration has expired",
-        ),
-        "User already exists": (
-            status.HTTP_409_CONFLICT,
-            "User account already exists",
-        ),
-    }
-
     # Extract token from Authorization header
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header missing or invalid format",
-        )
+    token = parse_bearer_token(authorization, "Authorization header missing or invalid format")
+    ip_address, user_agent = get_client_metadata(request)
 
-    token = authorization.split(" ", 1)[1]
+    # Every outcome is padded to the same minimum duration so token validity cannot be inferred from timing
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
 
     try:
+        password_hash = await hash_password_async(request_body.password)
+
+        # confirm_pending_user validates the token and registration itself (AU001-AU005)
         result = await db.execute(
-            text(
-                """
-                SELECT confirm_pending_user(
-                    p_app_id := :app_id,
-                    p_token_hash := :token_hash,
-                    p_password := :password,
-                    p_ip_address := :ip_address,
-                    p_user_agent := :user_agent
-                )"""
-            ),
+            _CONFIRM_PENDING_USER_SQL,
             {
                 "app_id": request_body.app_id,
                 "token_hash": hash_token(token),
-                "password": hash_password(request_body.password),
-                "ip_address": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent", ""),
+                "password": password_hash,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
             },
         )
-        await db.commit()
+        return RegisterConfirmationResponse.model_construct(user_id=result.scalar())
 
-        return RegisterConfirmationResponse(user_id=result.scalar())
+    except DBAPIError as e:
+        error = _CONFIRM_ERRORS.get(getattr(e.orig, "sqlstate", None))
 
-    except Exception as e:
-        error_str = str(e)
+        # Re-raise unknown database errors
+        if error is None:
+            raise
 
-        # Check for known database errors
-        for error_msg, (status_code, detail) in error_mappings.items():
-            if error_msg in error_str:
-                raise HTTPException(status_code=status_code, detail=detail)
+        status_code, detail = error
+        raise HTTPException(status_code=status_code, detail=detail)
 
-        # Re-raise unknown exceptions
-        raise
+    finally:
+        remaining = MIN_RESPONSE_TIME_SECONDS - (loop.time() - started_at)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
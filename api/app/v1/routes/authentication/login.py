@@ -9,32 +9,52 @@ Users are the primary entities that interact with applications, and this module
 - User deletion with verification
 """
 
-# from typing import Union
-
 from app.utility.authentication import (
     create_login_session,
     create_mfa_challenge_session,
+    get_client_metadata,
 )
-from app.utility.database import get_db
+from app.utility.database import get_autocommit_db
 from app.utility.response import create_login_response_with_cookies
 from app.utility.security.hashing import hash_email
-from app.utility.security.password import verify_password
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import text
+from app.utility.security.password import hash_password, verify_password_async
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import String, bindparam, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...schemas.user import UserLogin2faResponse, UserLoginRequest, UserLoginResponse
 
 router = APIRouter()
 
+# Verified against when the email is unknown so both failure paths cost one Argon2 verify
+_DUMMY_PASSWORD_HASH = hash_password("not-a-real-password")
+
+_LOGIN_USER_SQL = text("""
+    SELECT id, password_hash, is_email_verified, is_2fa_enabled, is_suspended FROM login_user (
+        p_app_id := :app_id,
+        p_email_hash := :email_hash
+    )""").bindparams(
+    # Declared once so the asyncpg dialect renders typed binds ($1::UUID, ...) instead of inferring per call
+    bindparam("app_id", type_=UUID),
+    bindparam("email_hash", type_=String),
+)
+
 
 @router.post(
     "",
     status_code=status.HTTP_200_OK,
-    # response_model=Union[UserLoginResponse, UserLogin2faResponse],
+    # Both branches build their own JSON response, so FastAPI has no response model to validate or encode
+    response_model=None,
     response_description="User logged in successfully",
 )
-async def login_user(request_body: UserLoginRequest, request: Request, db: AsyncSession = Depends(get_db)):
+async def login_user(
+    request_body: UserLoginRequest,
+    request: Request,
+    # The lookup and the session insert are independent function calls, so no transaction is held across the
+    # Argon2 verify and BEGIN/COMMIT round trips are skipped
+    db: AsyncSession = Depends(get_autocommit_db),
+):
     """
     Log in a user with email and password.
 
@@ -52,64 +72,47 @@ async def login_user(request_body: UserLoginRequest, request: Request, db: Async
     Raises:
         HTTPException: If authentication fails or user is not found
     """
-
-    # Define error mappings for cleaner exception handling
-    error_mappings = {
-        "User not found with specified email": (
-            status.HTTP_401_UNAUTHORIZED,
-            "Invalid credentials",
-        ),
-        "Invalid password": (
-            status.HTTP_401_UNAUTHORIZED,
-            "Invalid credentials",
-        ),
-        "User is suspended": (
-            status.HTTP_403_FORBIDDEN,
-            "User account is suspended",
-        ),
-    }
-
-    try:
-        result = await db.execute(
-            text(
-                """
-                SELECT * FROM login_user (
-                    p_app_id := :app_id,
-                    p_email_hash := :email_hash,
-                    p_ip_address := :ip_address,
-                    p_user_agent := :user_agent
-                )"""
-            ),
-            {
-                "app_id": request_body.app_id,
-                "email_hash": hash_email(request_body.email, request_body.app_id),
-                "ip_address": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent", ""),
-            },
+    result = await db.execute(
+        _LOGIN_USER_SQL,
+        {
+            "app_id": request_body.app_id,
+            "email_hash": hash_email(request_body.email, request_body.app_id),
+        },
+    )
+    data = result.first()
+
+    # Always run a password verification so unknown emails and wrong passwords take the same time
+    password_hash = data.password_hash if data else _DUMMY_PASSWORD_HASH
+    password_ok = await verify_password_async(request_body.password, password_hash)
+
+    if data is None or not password_ok:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+    # Only revealed to callers who know the password
+    if data.is_suspended:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User account is suspended")
+
+    ip_address, user_agent = get_client_metadata(request)
+
+    # Only expose the fields the response models need (never the password hash);
+    # the row is typed by the database, so the responses are built without re-validation
+    if data.is_2fa_enabled:
+        mfa_access_token = await create_mfa_challenge_session(data.id, db, request_body.app_id, ip_address, user_agent)
+        response_data = UserLogin2faResponse.model_construct(
+            id=data.id,
+            is_email_verified=data.is_email_verified,
+            is_2fa_enabled=True,
+            challenge_token=mfa_access_token,
         )
-        data = result.mappings().first()
-
-        if not data:
-            raise ValueError("User not found with specified email")
-
-        if not verify_password(request_body.password, data.password_hash):
-            raise ValueError("Invalid password")
-
-        # Convert to response model for adding tokens
-        user_dict = dict(data._mapping) if hasattr(data, "_mapping") else dict(data)
-
-        if data.is_2fa_enabled:
-            mfa_access_token = await create_mfa_challenge_session(data.id, db, request_body.app_id, request)
-            user_dict.update({"challenge_token": mfa_access_token})
-            return UserLogin2faResponse.model_validate(user_dict)
-
-        # Create session and refresh tokens for the opaque token flow
-        session = await create_login_session(data.id, db, request_body.app_id, request)
-
-        # Create response without tokens in body
-        response_data = UserLoginResponse.model_validate(user_dict).model_dump()
-        return create_login_response_with_cookies(response_data, session)
-
-    except ValueError as e:
-        status_code, detail = error_mappings.get(str(e), (500, "Unexpected error"))
-        raise HTTPException(status_code=status_code, detail=detail)
+        return Response(content=response_data.model_dump_json(), media_type="application/json")
+
+    # Create session and refresh tokens for the opaque token flow
+    session = await create_login_session(data.id, db, request_body.app_id, ip_address, user_agent)
+
+    # Create response without tokens in body
+    response_data = UserLoginResponse.model_construct(
+        id=data.id,
+        is_email_verified=data.is_email_verified,
+        is_2fa_enabled=False,
+    )
+    return create_login_response_with_cookies(response_data, session)
@@ -1,15 +1,15 @@
 from app.utility.authentication import (
     create_login_session,
     create_mfa_challenge_session,
+    get_client_metadata,
 )
 from app.utility.database import get_db
 from app.utility.response import create_login_response_with_cookies
 from app.utility.security.encryption import decrypt_field, encrypt_field
 from app.utility.security.hashing import hash_field
-from app.utility.security.mfa import verify_otp
+from app.utility.security.mfa import generate_otp_secret, verify_otp
 from app.utility.security.tokens import require_access_token, require_challenge_token
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from pyotp import random_base32 as generate_otp_secret
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +23,14 @@ from ....schemas.user import UserLoginResponse
 
 router = APIRouter()
 
+_INSERT_TOTP_SECRET_SQL = text("""
+    CALL insert_totp_secret(
+        p_user_id := :user_id,
+        p_secret_encrypted := :secret_encrypted,
+        p_secret_hash := :secret_hash,
+        p_key_version := :key_version
+    )""")
+
 
 @router.post(
     "/setup",
@@ -57,14 +65,7 @@ async def setup_totp_secret(
 
     try:
         await db.execute(
-            text(
-                """CALL insert_totp_secret(
-                    p_user_id := :user_id,
-                    p_secret_encrypted := :secret_encrypted,
-                    p_secret_hash := :secret_hash,
-                    p_key_version := :key_version
-                )"""
-            ),
+            _INSERT_TOTP_SECRET_SQL,
             {
                 "user_id": request_body.user_id,
                 "secret_encrypted": encrypt_field(otp_secret),
@@ -83,7 +84,9 @@ async def setup_totp_secret(
 
     # TODO: Generate the QR code URL and QR code for the user to scan
     # otpauth://totp/AppName:UserEmail?secret=otp_secret&issuer=AppName
-    mfa_access_token = await create_mfa_challenge_session(request_body.user_id, db, request_body.app_id, request)
+    mfa_access_token = await create_mfa_challenge_session(
+        request_body.user_id, db, request_body.app_id, *get_client_metadata(request)
+    )
 
     return TOTPSecretSetupResponse(secret=otp_secret, challenge_token=mfa_access_token)
 
@@ -125,24 +128,16 @@ async def confirm_2fa(
             detail="Invalid TOTP code",
         )
 
-    result = await db.execute(
-        text(
-            "SELECT get_email_verification_status(p_app_id := :p_app_id, p_user_id := :p_user_id) AS is_email_verified"
-        ),
-        {"p_app_id": challenge_data.app_id, "p_user_id": challenge_data.user_id},
+    # Create session and refresh tokens for the opaque token flow
+    session = await create_login_session(
+        challenge_data.user_id, db, challenge_data.app_id, *get_client_metadata(request)
     )
-    user_data = result.mappings().first()
 
-    # Create session and refresh tokens for the opaque token flow
-    session = await create_login_session(challenge_data.user_id, db, challenge_data.app_id, request)
-
-    # Create response
-    response_data = UserLoginResponse.model_validate(
-        {
-            **user_data,
-            "is_2fa_enabled": True,
-            "id": challenge_data.user_id,
-        }
-    ).model_dump()
+    # Create response; the values come from the typed get_totp_secret row, so no re-validation is needed
+    response_data = UserLoginResponse.model_construct(
+        id=challenge_data.user_id,
+        is_email_verified=challenge_data.is_email_verified,
+        is_2fa_enabled=True,
+    )
 
     return create_login_response_with_cookies(response_data, session)
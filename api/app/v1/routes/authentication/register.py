@@ -19,23 +19,25 @@ Security Features:
 - Email addresses are encrypted at rest and hashed for indexing
 - Passwords are hashed using Argon2ID
 - Verification tokens are cryptographically secure
-- Rate limiting through minimum response times
+- Rate limiting per client IP and per email address
 - IP address and user agent tracking for audit purposes
 """
 
 import asyncio
-import time
 import zoneinfo
 from datetime import datetime, timezone
+from functools import lru_cache
 from random import uniform as jitter
 
-from app.utility.database import get_db
-from app.utility.email.sender import send_email_background
+from app.utility.authentication import get_client_metadata
+from app.utility.database import get_autocommit_db
+from app.utility.email.sender import send_email
+from app.utility.rate_limit import RateLimiter, enforce_rate_limit, rate_limit_by_ip
 from app.utility.security.encryption import encrypt_field as encrypt_email
 from app.utility.security.hashing import hash_email
 from app.utility.security.tokens import create_token, hash_token
-from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
-from sqlalchemy import text
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
+from sqlalchemy import Row, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -45,17 +47,118 @@ from ...schemas.pending_user import RegisterRequest
 router = APIRouter()
 MIN_RESPONSE_TIME_SECONDS = 0.45
 
+# Registrations send email, so cap them per client and per address before any hashing or database work
+_REGISTER_IP_LIMITER = RateLimiter(limit=5, window_seconds=60)
+_REGISTER_EMAIL_LIMITER = RateLimiter(limit=3, window_seconds=3600)
+
+_REGISTER_PENDING_USER_SQL = text("""
+    SELECT expires_at, app_name FROM register_pending_user(
+        p_app_id := :app_id,
+        p_token_hash := :token_hash,
+        p_email_encrypted := :email_encrypted,
+        p_email_hash := :email_hash,
+        p_ip_address := :ip_address,
+        p_user_agent := :user_agent
+    )""")
+
+_UTC_FORMAT = "%B %d, %Y at %I:%M %p UTC"
+_LOCAL_FORMAT = "%B %d, %Y at %I:%M %p"
+
+
+@lru_cache(maxsize=256)
+def _get_zone(name: str) -> zoneinfo.ZoneInfo | None:
+    """Load a time zone once per process, memoizing unknown names as None."""
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def _format_expiration_time(expires_at: datetime, timezone_str: str | None) -> str:
+    """
+    Format an expiration timestamp as a human readable string in the user's time zone.
+
+    Falls back to UTC when no time zone is given or the time zone is unknown.
+    """
+    if not isinstance(expires_at, datetime):
+        return str(expires_at)
+
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+
+    user_tz = _get_zone(timezone_str) if timezone_str else None
+    if user_tz is None:
+        return expires_at.strftime(_UTC_FORMAT)
+
+    expires_at_local = expires_at.astimezone(user_tz)
+    return f"{expires_at_local.strftime(_LOCAL_FORMAT)} {expires_at_local.tzname()}"
+
+
+async def _send_verification_email(
+    request_body: RegisterRequest, verification_token: str, app_name: str, expires_at: datetime
+):
+    """Format the expiration time and send the verification email; runs after the response has been sent."""
+    expires_at_formatted = _format_expiration_time(expires_at, request_body.timezone)
+
+    # Every field is either already validated on the request or built here, so skip re-validation
+    await send_email(
+        RegistrationEmailSchema.model_construct(
+            recipients=[request_body.email],
+            subject=f"{app_name} - Email Verification",
+            body={
+                "title": app_name,
+                "confirmation_url": f"{request_body.confirmation_url}?token={verification_token}",
+                "expires_at": expires_at_formatted,
+            },
+            template_path="registration_email_v1.html",
+        )
+    )
+
+
+async def _register_pending_user(
+    db: AsyncSession, request_body: RegisterRequest, request: Request, verification_token: str, email_hash: str
+) -> Row | None:
+    """
+    Create the pending user record and its verification token.
+
+    Returns:
+        The token expiration time and application name, or None if the registration was rejected
+        (e.g., duplicate email).
+    """
+    ip_address, user_agent = get_client_metadata(request)
+
+    try:
+        result = await db.execute(
+            _REGISTER_PENDING_USER_SQL,
+            {
+                "app_id": request_body.app_id,
+                # Microseconds of HMAC/AES-GCM work, cheaper inline than a thread hop; only Argon2 is offloaded
+                "token_hash": hash_token(verification_token),
+                "email_encrypted": encrypt_email(request_body.email),
+                "email_hash": email_hash,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+            },
+        )
+        return result.one_or_none()
+
+    # Silently handle integrity errors (e.g., duplicate email)
+    except IntegrityError:
+        return None
+
 
 @router.post(
     "",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
     response_description="Verification email sent successfully",
+    dependencies=[Depends(rate_limit_by_ip(_REGISTER_IP_LIMITER))],
 )
 async def register_pending_user(
     background_tasks: BackgroundTasks,
     request_body: RegisterRequest,
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_autocommit_db),
 ):
     """
     Initiate user registration by creating a pending user record and sending verification email.
@@ -85,82 +188,28 @@ async def register_pending_user(
         - Client IP and user agent tracking for audit logs
 
     Raises:
-        HTTPException: Only for unexpected database errors (integrity errors are silenced)
+        HTTPException: 429 if the client IP or email exceeds its registration quota
     """
-    start = time.monotonic() + jitter(0, 0.1)
+    # Keyed on the stored email hash so plaintext addresses are never kept in memory
+    email_hash = hash_email(request_body.email, request_body.app_id)
+    enforce_rate_limit(_REGISTER_EMAIL_LIMITER, email_hash)
+
     verification_token = create_token()
 
-    try:
-        result = await db.execute(
-            text(
-                """
-                SELECT register_pending_user(
-                    p_app_id := :app_id,
-                    p_token_hash := :token_hash,
-                    p_email_encrypted := :email_encrypted,
-                    p_email_hash := :email_hash,
-                    p_ip_address := :ip_address,
-                    p_user_agent := :user_agent
-                )
-                """
-            ),
-            {
-                "app_id": request_body.app_id,
-                "token_hash": hash_token(verification_token),
-                "email_encrypted": encrypt_email(request_body.email),
-                "email_hash": hash_email(request_body.email, request_body.app_id),
-                "ip_address": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent", ""),
-            },
-        )
-        expires_at = result.scalar_one_or_none()
+    # Run the database work alongside the minimum response time instead of after it
+    deadline = MIN_RESPONSE_TIME_SECONDS + jitter(0, 0.1)
+    registration, _ = await asyncio.gather(
+        _register_pending_user(db, request_body, request, verification_token, email_hash),
+        asyncio.sleep(deadline),
+    )
 
-    # Silently handle integrity errors (e.g., duplicate email)
-    except IntegrityError:
-        expires_at = None
-
-    elapsed = time.monotonic() - start
-    remaining_time = max(0, MIN_RESPONSE_TIME_SECONDS - elapsed)
-    if remaining_time:
-        await asyncio.sleep(remaining_time)
-
-    if expires_at is None:
-        return
-
-    await db.commit()
-
-    # Format expires_at to human readable string
-    if isinstance(expires_at, datetime):
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-
-        if request_body.timezone:
-            try:
-                user_tz = zoneinfo.ZoneInfo(request_body.timezone)
-                expires_at_local = expires_at.astimezone(user_tz)
-                tz_name = expires_at_local.strftime("%Z")
-                expires_at_formatted = expires_at_local.strftime(f"%B %d, %Y at %I:%M %p {tz_name}")
-            except (zoneinfo.ZoneInfoNotFoundError, ValueError):
-                expires_at_formatted = expires_at.strftime("%B %d, %Y at %I:%M %p UTC")
-        else:
-            expires_at_formatted = expires_at.strftime("%B %d, %Y at %I:%M %p UTC")
-    else:
-        expires_at_formatted = str(expires_at)
-
-    # Retrieve the application name from the database
-    result = await db.execute(text("SELECT get_application_name(:app_id)"), {"app_id": request_body.app_id})
-    app_name = result.scalar_one_or_none()
-
-    send_email_background(
-        background_tasks,
-        RegistrationEmailSchema(
-            recipients=[request_body.email],
-            subject=f"{app_name} - Email Verification",
-            body={
-                "title": app_name,
-                "confirmation_url": f"{request_body.confirmation_url}?token={verification_token}",
-                "expires_at": expires_at_formatted,
-            },
-            template_path="registration_email_v1.html",
-        ),
+    if registration is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    # Format and send the email once the response has been sent
+    background_tasks.add_task(
+        _send_verification_email, request_body, verification_token, registration.app_name, registration.expires_at
     )
+
+    # FastAPI attaches the background tasks to a returned response that has none of its own
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -6,7 +6,7 @@ This module defines the Pydantic models used for request and response validation
 
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .common import CommonFieldTypes
 
@@ -78,13 +78,6 @@ class AppCreateResponse(BaseModel):
     app_id: AppFieldTypes.Id
 
 
-class AppDelete(BaseModel):
-    """Schema for deleting an application."""
-
-    app_id: AppFieldTypes.Id
-    slug: AppFieldTypes.Slug
-
-
 class AppDeleteResponse(BaseModel):
     """Schema for application deletion response."""
 
@@ -101,8 +94,7 @@ class AppGetResponse(BaseModel):
     created_at: AppFieldTypes.CreatedAt
     updated_at: CommonFieldTypes.NonFutureTimestamp | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AppUpdate(BaseModel):
@@ -125,5 +117,4 @@ class AppUpdateResponse(BaseModel):
     is_active: AppFieldTypes.IsActive
     updated_at: AppFieldTypes.UpdatedAt
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
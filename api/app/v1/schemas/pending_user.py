@@ -40,6 +40,8 @@ class RegisterRequest(BaseModel):
         Field(
             title="Confirmation URL",
             description="The URL to confirm the pending user registration.",
+            min_length=1,
+            max_length=2048,
         ),
     ]
 
@@ -10,7 +10,7 @@ from string import ascii_letters
 from typing import Annotated
 
 from app.utility.security.password import hash_password, validate_password_complexity
-from pydantic import AfterValidator, BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 from .application import AppFieldTypes
 from .common import CommonFieldTypes
@@ -118,20 +118,19 @@ class UserLoginResponse(BaseModel):
     is_email_verified: UserFieldTypes.IsEmailVerified
     is_2fa_enabled: UserFieldTypes.Is2FAEnabled
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserLogin2faResponse(BaseModel):
     """
-    Response schema for user login.
+    Response schema for user login when 2FA is enabled.
 
-    This schema is used to return the user ID after successful login.
+    This schema is used to return the user ID and the challenge token to complete the 2FA step.
     """
 
     id: UserFieldTypes.Id
     is_email_verified: UserFieldTypes.IsEmailVerified
     is_2fa_enabled: UserFieldTypes.Is2FAEnabled
+    challenge_token: CommonFieldTypes.Token
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,9 @@
+import hashlib
+import hmac
 import re
 
 import pytest
-from app.utility.security.tokens import create_token
+from app.utility.security.tokens import TOKEN_PEPPER, create_token, hash_token
 
 
 @pytest.fixture
@@ -32,3 +34,22 @@ def test_create_verification_token_format(verification_token):
     The token should be URL-safe, containing alphanumeric characters and hyphens.
     """
     assert re.match(r"^[A-Za-z0-9_-]+$", verification_token)
+
+
+def test_hash_token_matches_peppered_hmac(verification_token):
+    """
+    Test that `hash_token` is the HMAC-SHA256 of the token keyed with the pepper.
+    Reusing the keyed HMAC state must not change stored token hashes.
+    """
+    expected = hmac.new(TOKEN_PEPPER, verification_token.encode(), hashlib.sha256).digest()
+    assert hash_token(verification_token) == expected
+
+
+def test_hash_token_does_not_mutate_keyed_state():
+    """
+    Test that hashing several tokens in a row gives the same digests as fresh HMACs.
+    Each call must copy the keyed state rather than feed the shared one.
+    """
+    tokens = [create_token(), create_token(), create_token()]
+    for token in tokens + tokens[::-1]:
+        assert hash_token(token) == hmac.new(TOKEN_PEPPER, token.encode(), hashlib.sha256).digest()
@@ -1,3 +1,4 @@
+import hashlib
 import re
 
 import pytest
@@ -41,3 +42,29 @@ def test_hash_field_format(hashed_email, hashed_phone):
     """
     assert re.match(r"^[0-9a-f]{64}$", hashed_email)
     assert re.match(r"^[0-9a-f]{64}$", hashed_phone)
+
+
+def test_hash_field_matches_namespaced_sha256(sample_phone):
+    """
+    Test that the hashed field is the SHA-256 of "namespace:value".
+    This ensures that caching the namespace prefix does not change stored hashes.
+    """
+    expected = hashlib.sha256(f"test_namespace:{sample_phone}".encode()).hexdigest()
+    assert hash_field(sample_phone, namespace="test_namespace") == expected
+
+
+def test_hash_field_does_not_mutate_cached_namespace_state(sample_email, sample_phone):
+    """
+    Test that interleaving values and namespaces gives the same hashes as fresh SHA-256 states.
+    Each call must copy the cached namespace prefix rather than feed the shared state.
+    """
+    calls = [
+        (sample_phone, "namespace_a"),
+        (sample_email, "namespace_b"),
+        (sample_email, "namespace_a"),
+        (sample_phone, "namespace_b"),
+        (sample_phone, "namespace_a"),
+    ]
+    for value, namespace in calls:
+        expected = hashlib.sha256(f"{namespace}:{value}".encode()).hexdigest()
+        assert hash_field(value, namespace=namespace) == expected
@@ -0,0 +1,20 @@
+import pytest
+from app.utility.security.tokens import parse_bearer_token
+from fastapi import HTTPException
+
+
+def test_parse_bearer_token_returns_token():
+    assert parse_bearer_token("Bearer abc123", "Invalid header") == "abc123"
+
+
+def test_parse_bearer_token_strips_whitespace():
+    assert parse_bearer_token("Bearer  abc123 ", "Invalid header") == "abc123"
+
+
+@pytest.mark.parametrize("header_value", [None, "", "Basic abc123", "bearer abc123", "Bearer"])
+def test_parse_bearer_token_rejects_invalid_headers(header_value):
+    with pytest.raises(HTTPException) as exc_info:
+        parse_bearer_token(header_value, "Invalid header")
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Invalid header"
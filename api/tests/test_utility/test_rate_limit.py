@@ -0,0 +1,98 @@
+import pytest
+from app.utility import rate_limit
+from app.utility.rate_limit import RateLimiter, enforce_rate_limit
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fixture to provide a controllable monotonic clock for the rate limiter."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_rate_limiter_allows_up_to_limit():
+    """
+    Test that a key is allowed exactly `limit` hits per window.
+    This ensures that the hit after the quota is rejected.
+    """
+    limiter = RateLimiter(limit=3, window_seconds=60)
+
+    assert [limiter.hit("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+
+
+def test_rate_limiter_tracks_keys_separately():
+    """
+    Test that each key has its own counter.
+    This ensures that one client exhausting its quota does not affect another.
+    """
+    limiter = RateLimiter(limit=1, window_seconds=60)
+
+    assert limiter.hit("1.2.3.4")
+    assert limiter.hit("5.6.7.8")
+    assert not limiter.hit("1.2.3.4")
+
+
+def test_rate_limiter_resets_after_window(clock):
+    """
+    Test that a key is allowed again once its window has elapsed.
+    This ensures that rejected clients are not blocked forever.
+    """
+    limiter = RateLimiter(limit=1, window_seconds=60)
+
+    assert limiter.hit("1.2.3.4")
+    assert not limiter.hit("1.2.3.4")
+
+    clock[0] += 60
+    assert limiter.hit("1.2.3.4")
+
+
+def test_rate_limiter_admits_new_keys_at_capacity():
+    """
+    Test that a new key is still admitted once `max_keys` keys are tracked.
+    This ensures that a flood of distinct keys cannot lock out new clients, while recent keys keep their counts.
+    """
+    limiter = RateLimiter(limit=1, window_seconds=60, max_keys=3)
+
+    for key in ("a", "b", "c"):
+        assert limiter.hit(key)
+
+    assert limiter.hit("d")
+    assert not limiter.hit("c")
+    assert not limiter.hit("d")
+
+
+def test_rate_limiter_keeps_live_windows_when_pruning(clock):
+    """
+    Test that a key over its quota is still rejected after expired windows have been pruned.
+    This ensures that pruning only forgets windows that have already elapsed.
+    """
+    limiter = RateLimiter(limit=1, window_seconds=60)
+    assert limiter.hit("expired")
+
+    clock[0] += 30
+    assert limiter.hit("live")
+    assert not limiter.hit("live")
+
+    # Past the prune interval and the first window, so the next hit prunes "expired" but not "live"
+    clock[0] += 31
+    assert limiter.hit("other")
+    assert not limiter.hit("live")
+    assert limiter.hit("expired")
+
+
+def test_enforce_rate_limit_sets_remaining_retry_after(clock):
+    """
+    Test that a rejected hit raises HTTP 429 with the time left in the window.
+    This ensures that clients are not told to wait longer than necessary.
+    """
+    limiter = RateLimiter(limit=1, window_seconds=60)
+    enforce_rate_limit(limiter, "1.2.3.4")
+
+    clock[0] += 45.5
+    with pytest.raises(HTTPException) as exc_info:
+        enforce_rate_limit(limiter, "1.2.3.4")
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "15"}
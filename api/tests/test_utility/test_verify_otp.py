@@ -1,6 +1,6 @@
 import pyotp
 import pytest
-from app.utility.security.mfa import verify_otp
+from app.utility.security.mfa import generate_otp_secret, verify_otp
 
 
 @pytest.fixture
@@ -56,3 +56,9 @@ def test_verify_otp_invalid_secret():
 def test_verify_otp_invalid_code_type(totp_secret):
     otp_code = None
     assert verify_otp(totp_secret, otp_code, "TOTP") is False
+
+
+def test_generate_otp_secret_is_usable_by_pyotp():
+    secret = generate_otp_secret()
+    assert len(secret) == 32
+    assert verify_otp(secret, pyotp.TOTP(secret).now(), "TOTP") is True
@@ -1,5 +1,12 @@
+import asyncio
+
 import pytest
-from app.utility.security.password import hash_password, verify_password
+from app.utility.security.password import (
+    _get_argon2_limiter,
+    hash_password,
+    verify_password,
+    verify_password_async,
+)
 from argon2 import PasswordHasher
 
 ph = PasswordHasher()
@@ -54,3 +61,19 @@ def test_verify_password_tampered(sample_password, hashed_password):
     """
     tampered_hash = hashed_password[:-5] + "xyz"  # Modify the hash slightly
     assert verify_password(sample_password, tampered_hash) is False
+
+
+def test_verify_password_async_across_event_loops(sample_password, hashed_password):
+    """
+    Test that the async verification works from successive event loops, each with its own limiter.
+    This ensures that the Argon2 concurrency limiter is not bound to the first loop that used it.
+    """
+
+    async def verify():
+        return await verify_password_async(sample_password, hashed_password), _get_argon2_limiter()
+
+    first_ok, first_limiter = asyncio.run(verify())
+    second_ok, second_limiter = asyncio.run(verify())
+
+    assert first_ok is True and second_ok is True
+    assert first_limiter is not second_limiter
@@ -12,6 +12,8 @@ DECLARE
     v_user_id UUID;
     v_existing_user_id UUID;
 BEGIN
+    -- Errors use custom SQLSTATEs (class AU) so callers can dispatch on the code instead of the message
+
     -- Look up the token first
     SELECT *
     INTO v_token
@@ -22,12 +24,12 @@ BEGIN
 
     -- If no token found, raise an error
     IF NOT FOUND THEN
-        RAISE EXCEPTION 'Invalid verification token';
+        RAISE EXCEPTION 'Invalid verification token' USING ERRCODE = 'AU001';
     END IF;
 
     -- Check if the token is expired
     IF v_token.expires_at < current_timestamp THEN
-        RAISE EXCEPTION 'Token has expired';
+        RAISE EXCEPTION 'Token has expired' USING ERRCODE = 'AU002';
     END IF;
 
     -- Look up the pending user by token_id
@@ -38,12 +40,12 @@ BEGIN
 
     -- If no pending user found, raise an error
     IF NOT FOUND THEN
-        RAISE EXCEPTION 'Pending user not found';
+        RAISE EXCEPTION 'Pending user not found' USING ERRCODE = 'AU003';
     END IF;
 
     -- Check if the pending user record is expired
     IF v_pending_user.expires_at < current_timestamp THEN
-        RAISE EXCEPTION 'Registration has expired';
+        RAISE EXCEPTION 'Registration has expired' USING ERRCODE = 'AU004';
     END IF;
 
     -- Check if user already exists
@@ -54,7 +56,7 @@ BEGIN
     IF FOUND THEN
         -- User already exists, clean up pending registration and return existing user ID
         DELETE FROM pending_users WHERE id = v_pending_user.id;
-        RAISE EXCEPTION 'User already exists';
+        RAISE EXCEPTION 'User already exists' USING ERRCODE = 'AU005';
     END IF;
 
     -- Create the new user
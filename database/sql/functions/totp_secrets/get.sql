@@ -6,7 +6,8 @@ CREATE OR REPLACE FUNCTION get_totp_secret(
     secret_encrypted NON_EMPTY_TEXT,
     key_version SMALLINT,
     created_at NON_FUTURE_TIMESTAMPTZ,
-    confirmed_at NON_FUTURE_TIMESTAMPTZ
+    confirmed_at NON_FUTURE_TIMESTAMPTZ,
+    is_email_verified BOOLEAN
 ) AS $$
 DECLARE
     v_app_id UUID;
@@ -19,13 +20,14 @@ BEGIN
 
     -- If no user ID is found, raise an exception
     IF v_user_id IS NULL THEN
-        RAISE EXCEPTION 'TOTP token not found';
+        RAISE EXCEPTION 'TOTP token not found' USING ERRCODE = 'AU006';
     END IF;
 
-    -- Select the TOTP secret details for the user and include app_id
+    -- Select the TOTP secret details for the user and include app_id and the email verification status
     RETURN QUERY
-    SELECT v_app_id, v_user_id, ts.secret_encrypted, ts.key_version, ts.created_at, ts.confirmed_at
+    SELECT v_app_id, v_user_id, ts.secret_encrypted, ts.key_version, ts.created_at, ts.confirmed_at, u.is_email_verified
     FROM totp_secrets ts
+    JOIN users u ON u.id = ts.user_id AND u.app_id = v_app_id
     WHERE ts.user_id = v_user_id;
 END;
 $$ LANGUAGE plpgsql;
@@ -1,14 +1,13 @@
 CREATE OR REPLACE FUNCTION login_user(
     p_app_id UUID,
-    p_email_hash TEXT,
-    p_ip_address INET,
-    p_user_agent TEXT
+    p_email_hash TEXT
 )
 RETURNS TABLE (
     id UUID,
     password_hash ARGON2ID_HASH,
     is_email_verified BOOLEAN,
-    is_2fa_enabled BOOLEAN
+    is_2fa_enabled BOOLEAN,
+    is_suspended BOOLEAN
 ) AS $$
 DECLARE
     v_user users%ROWTYPE;
@@ -20,22 +19,18 @@ BEGIN
     WHERE email_hash = p_email_hash
     AND app_id = p_app_id;
 
-    -- If no user found, raise an error
+    -- If no user found, return no rows so the caller can run a dummy password check
     IF NOT FOUND THEN
-        RAISE EXCEPTION 'User not found with specified email';
+        RETURN;
     END IF;
 
-    -- Check if the user is suspended
-    IF v_user.is_suspended THEN
-        RAISE EXCEPTION 'User is suspended';
-    END IF;
-
-    -- Return user details using the variable data
+    -- Return user details using the variable data; the caller rejects suspended users after the password check
     RETURN QUERY SELECT
         v_user.id,
         v_user.password_hash,
         v_user.is_email_verified,
-        v_user.is_2fa_enabled;
+        v_user.is_2fa_enabled,
+        v_user.is_suspended;
 END;
 $$ LANGUAGE plpgsql;
 